@@ -17,9 +17,6 @@ try:
 except ImportError:
     pass
 
-from colour.models import RGB_to_XYZ, XYZ_to_Lab
-from colour.colorimetry import ILLUMINANTS
-
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
 __license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
@@ -27,8 +24,10 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['dag_path',
+__all__ = ['USE_NUMBA',
+           'dag_path',
            'mpoint',
+           'float_point_array',
            'shapes',
            'set_attributes',
            'RGB_to_Lab',
@@ -36,6 +35,40 @@ __all__ = ['dag_path',
            'Lab_colourspace_cube',
            'Lab_coordinates_system_representation']
 
+USE_NUMBA = False
+"""
+Whether to convert *RGB* values to *CIE Lab* colourspace with a *Numba*
+kernel when *Numba* is available. *Numba* is only imported, and the kernel
+compiled, on first use. The kernel was measured slower than the *NumPy* path
+on a single core at every vertices count, thus it is disabled by default.
+
+USE_NUMBA : bool
+"""
+
+_RGB_TO_LAB_NUMBA = None
+"""
+*Numba* kernel converting linear *RGB* values to *CIE Lab* colourspace,
+*None* until built and *False* if it cannot be built.
+
+_RGB_TO_LAB_NUMBA : callable or bool
+"""
+
+_RGB_TO_LAB_CONSTANTS = {}
+"""
+Cache of the *RGB* colourspaces to *CIE Lab* conversion constants, keyed by
+colourspace name, whitepoint and *RGB* to *CIE XYZ* matrix.
+
+_RGB_TO_LAB_CONSTANTS : dict
+"""
+
+_BUFFERS = {}
+"""
+Cache of the (N, 3) arrays reused across cubes builds, only the arrays for
+the last requested vertices count are kept.
+
+_BUFFERS : dict
+"""
+
 
 def dag_path(node):
     """
@@ -77,6 +110,37 @@ def mpoint(point):
     return OpenMaya.MPoint(point[0], point[1], point[2])
 
 
+def float_point_array(points):
+    """
+    Converts given (N, 3) array of points to MFloatPointArray.
+
+    The points are flattened to a list of homogeneous coordinates which
+    *MScriptUtil* reads into a float array from which the MFloatPointArray is
+    created in a single call, i.e. without constructing a MPoint per point.
+    A Python float is still created per coordinate.
+
+    Parameters
+    ----------
+    points : array_like
+        (N, 3) array of points.
+
+    Returns
+    -------
+    MFloatPointArray
+        MFloatPointArray.
+    """
+
+    points = np.reshape(points, (-1, 3))
+    buffer = np.ones((points.shape[0], 4), dtype=np.float32)
+    buffer[:, :3] = points
+
+    script_util = OpenMaya.MScriptUtil()
+    script_util.createFromList(buffer.ravel().tolist(), buffer.size)
+
+    return OpenMaya.MFloatPointArray(script_util.asFloat4Ptr(),
+                                     points.shape[0])
+
+
 def shapes(object, full_path=False, no_intermediate=True):
     """
     Returns shapes of given object.
@@ -109,12 +173,12 @@ def shapes(object, full_path=False, no_intermediate=True):
 
 def set_attributes(attributes):
     """
-    Sets given attributes.
+    Sets given attributes within a single undo chunk.
 
     Parameters
     ----------
-    attributes : dict
-        Attributes to set.
+    attributes : iterable
+        Attributes to set as *(node, attribute, value)* tuples.
 
     Returns
     -------
@@ -122,42 +186,251 @@ def set_attributes(attributes):
         Definition success.
     """
 
-    for attribute, value in attributes.items():
-        cmds.setAttr(attribute, value)
+    cmds.undoInfo(openChunk=True)
+    try:
+        for node, attribute, value in attributes:
+            cmds.setAttr('{0}.{1}'.format(node, attribute), value)
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
     return True
 
 
 def RGB_to_Lab(RGB, colourspace):
     """
-    Converts given *RGB* value from given colourspace to *CIE Lab* colourspace.
+    Converts given *RGB* values from given colourspace to *CIE Lab*
+    colourspace.
 
     Parameters
     ----------
     RGB : array_like
-        *RGB* value.
+        *RGB* values, e.g. an (N, 3) array of vertices positions.
     colourspace : RGB_Colourspace
         *RGB* colourspace.
 
     Returns
     -------
-    bool
-        Definition success.
+    ndarray
+        *CIE Lab* values.
+
+    Notes
+    -----
+    -   The computations are performed in single precision, i.e.
+        :class:`np.float32`, matching the precision of the *Autodesk Maya*
+        vertices positions.
     """
 
-    return XYZ_to_Lab(
-        RGB_to_XYZ(np.array(RGB),
-                   colourspace.whitepoint,
-                   ILLUMINANTS.get(
-                       'CIE 1931 2 Degree Standard Observer').get('E'),
-                   colourspace.to_XYZ,
-                   'Bradford',
-                   colourspace.cctf_decoding),
-        colourspace.whitepoint)
+    RGB = np.asarray(RGB, dtype=np.float32)
+    shape = RGB.shape
+    RGB = np.ascontiguousarray(np.reshape(RGB, (-1, 3)))
 
+    Lab = _RGB_to_Lab(RGB,
+                      colourspace,
+                      np.empty(RGB.shape, dtype=np.float32),
+                      np.empty(RGB.shape, dtype=np.float32),
+                      np.empty(RGB.shape, dtype=np.float32))
 
-def RGB_identity_cube(name, density=20):
+    return np.reshape(Lab, shape)
+
+
+def _RGB_to_Lab(RGB, colourspace, RGB_l, XYZ, Lab):
     """
-    Creates an RGB identity cube with given name and geometric density.
+    Converts given (N, 3) array of *RGB* values from given colourspace to
+    *CIE Lab* colourspace using given arrays for the intermediate and output
+    values.
+
+    Parameters
+    ----------
+    RGB : ndarray
+        (N, 3) array of *RGB* values.
+    colourspace : RGB_Colourspace
+        *RGB* colourspace.
+    RGB_l : ndarray
+        (N, 3) array receiving the linear *RGB* values.
+    XYZ : ndarray
+        (N, 3) array receiving the *CIE XYZ* tristimulus values, overwritten
+        during the conversion.
+    Lab : ndarray
+        (N, 3) array receiving the *CIE Lab* values.
+
+    Returns
+    -------
+    ndarray
+        *CIE Lab* values, i.e. ``Lab`` argument.
+    """
+
+    RGB_l[...] = colourspace.cctf_decoding(RGB)
+
+    matrix, XYZ_r = _RGB_to_Lab_constants(colourspace)
+
+    if USE_NUMBA:
+        RGB_to_Lab_numba = _RGB_to_Lab_numba()
+        if RGB_to_Lab_numba is not None:
+            RGB_to_Lab_numba(RGB_l, matrix, XYZ_r, Lab)
+            return Lab
+
+    np.dot(RGB_l, matrix, out=XYZ)
+
+    return _XYZ_to_Lab(XYZ, XYZ_r, Lab)
+
+
+def _buffers(count):
+    """
+    Returns the (N, 3) arrays reused across cubes builds for given vertices
+    count, allocating them, and discarding the previous ones, if the vertices
+    count changed.
+
+    Parameters
+    ----------
+    count : int
+        Vertices count.
+
+    Returns
+    -------
+    tuple
+        *RGB*, linear *RGB*, *CIE XYZ* and *CIE Lab* arrays.
+    """
+
+    buffers = _BUFFERS.get(count)
+    if buffers is None:
+        buffers = tuple(np.empty((count, 3), dtype=np.float32)
+                        for _ in range(4))
+        _BUFFERS.clear()
+        _BUFFERS[count] = buffers
+
+    return buffers
+
+
+def _RGB_to_Lab_constants(colourspace):
+    """
+    Returns the matrix converting linear *RGB* values from given colourspace
+    to *CIE XYZ* tristimulus values adapted to *CIE Illuminant E* using
+    *Bradford* chromatic adaptation transform and the colourspace whitepoint
+    *CIE XYZ* tristimulus values.
+
+    The matrix is returned transposed and C-contiguous so that (N, 3) arrays
+    of *RGB* values can be right-multiplied directly.
+
+    *Colour* is imported on first call only so that importing this module
+    does not import it.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace.
+
+    Returns
+    -------
+    tuple
+        Transposed *RGB* colourspace to *CIE XYZ* matrix and whitepoint
+        *CIE XYZ* tristimulus values.
+    """
+
+    key = (colourspace.name,
+           tuple(np.ravel(colourspace.whitepoint)),
+           np.asarray(colourspace.to_XYZ, dtype=np.float64).tobytes())
+    constants = _RGB_TO_LAB_CONSTANTS.get(key)
+    if constants is None:
+        from colour.adaptation import chromatic_adaptation_matrix_VonKries
+        from colour.colorimetry import ILLUMINANTS
+        from colour.models import xy_to_XYZ
+
+        XYZ_r = xy_to_XYZ(colourspace.whitepoint)
+        matrix = np.ascontiguousarray(
+            np.dot(
+                chromatic_adaptation_matrix_VonKries(
+                    XYZ_r,
+                    xy_to_XYZ(ILLUMINANTS[
+                        'CIE 1931 2 Degree Standard Observer']['E']),
+                    'Bradford'),
+                colourspace.to_XYZ).T,
+            dtype=np.float32)
+        constants = matrix, np.asarray(XYZ_r, dtype=np.float32)
+        _RGB_TO_LAB_CONSTANTS[key] = constants
+
+    return constants
+
+
+def _XYZ_to_Lab(XYZ, XYZ_r, Lab):
+    """
+    Converts given (N, 3) array of *CIE XYZ* tristimulus values to *CIE Lab*
+    colourspace.
+
+    The non-linearity is evaluated over the whole array with :func:`np.cbrt`
+    writing into the given *CIE XYZ* array, the values in the linear segment
+    being computed separately through a boolean mask.
+
+    Parameters
+    ----------
+    XYZ : ndarray
+        (N, 3) array of *CIE XYZ* tristimulus values, overwritten during the
+        conversion.
+    XYZ_r : array_like
+        Reference *illuminant* *CIE XYZ* tristimulus values.
+    Lab : ndarray
+        (N, 3) array receiving the *CIE Lab* values.
+
+    Returns
+    -------
+    ndarray
+        *CIE Lab* values, i.e. ``Lab`` argument.
+    """
+
+    XYZ_f = np.divide(XYZ, XYZ_r, out=XYZ)
+    linear = XYZ_f <= (24 / 116) ** 3
+    XYZ_f_l = (841 / 108) * XYZ_f[linear] + 16 / 116
+    np.cbrt(XYZ_f, out=XYZ_f)
+    XYZ_f[linear] = XYZ_f_l
+
+    np.subtract(XYZ_f[:, 0], XYZ_f[:, 1], out=Lab[:, 1])
+    np.subtract(XYZ_f[:, 1], XYZ_f[:, 2], out=Lab[:, 2])
+    np.multiply(XYZ_f[:, 1], 116, out=Lab[:, 0])
+    Lab[:, 0] -= 16
+    Lab[:, 1] *= 500
+    Lab[:, 2] *= 200
+
+    return Lab
+
+
+def _set_points(fn_mesh, points):
+    """
+    Sets the vertices positions of given mesh to given (N, 3) array of points
+    in object space.
+
+    The points are set in bulk with :func:`float_point_array` definition,
+    falling back to a *MItMeshVertex* walk if the *MFloatPointArray* cannot
+    be created in the running *Autodesk Maya* version.
+
+    Parameters
+    ----------
+    fn_mesh : MFnMesh
+        Mesh function set.
+    points : ndarray
+        (N, 3) array of points.
+    """
+
+    try:
+        float_points = float_point_array(points)
+    except (AttributeError, NotImplementedError, TypeError):
+        # "MPoint" only accepts Python floats, not "np.float32" scalars.
+        it_mesh_vertex = OpenMaya.MItMeshVertex(fn_mesh.dagPath())
+        while not it_mesh_vertex.isDone():
+            it_mesh_vertex.setPosition(
+                mpoint(points[it_mesh_vertex.index()].tolist()),
+                OpenMaya.MSpace.kObject)
+            it_mesh_vertex.next()
+    else:
+        fn_mesh.setPoints(float_points, OpenMaya.MSpace.kObject)
+
+
+def _cube(name, density=20, transform=None):
+    """
+    Creates a cube with given name and geometric density whose vertices
+    colours are their *RGB* identity positions and whose vertices positions
+    are optionally transformed with given definition.
+
+    The cube vertices are read once and both the vertices colours and
+    positions are written from the same *RGB* array.
 
     Parameters
     ----------
@@ -165,6 +438,9 @@ def RGB_identity_cube(name, density=20):
         Cube name.
     density : int, optional
         Cube divisions count.
+    transform : callable, optional
+        Definition transforming the (N, 3) array of *RGB* identity positions
+        to the (N, 3) array of vertices positions.
 
     Returns
     -------
@@ -179,28 +455,51 @@ def RGB_identity_cube(name, density=20):
                          sy=density,
                          sz=density,
                          ch=False)[0]
-    set_attributes({'{0}.translateX'.format(cube): .5,
-                    '{0}.translateY'.format(cube): .5,
-                    '{0}.translateZ'.format(cube): .5})
     cmds.setAttr('{0}.displayColors'.format(cube), True)
 
     vertex_colour_array = OpenMaya.MColorArray()
     vertex_index_array = OpenMaya.MIntArray()
     point_array = OpenMaya.MPointArray()
     fn_mesh = OpenMaya.MFnMesh(dag_path(shapes(cube)[0]))
-    fn_mesh.getPoints(point_array, OpenMaya.MSpace.kWorld)
-    for i in range(point_array.length()):
-        vertex_colour_array.append(point_array[i][0],
-                                   point_array[i][1],
-                                   point_array[i][2])
-        vertex_index_array.append(i)
+    fn_mesh.getPoints(point_array, OpenMaya.MSpace.kObject)
+    count = point_array.length()
+    RGB = _buffers(count)[0]
+    vertex_colour_array.setLength(count)
+    vertex_index_array.setLength(count)
+    for i in range(count):
+        # The polygonal cube is centred on origin.
+        point = point_array[i]
+        R, G, B = point[0] + .5, point[1] + .5, point[2] + .5
+        RGB[i] = (R, G, B)
+        vertex_colour_array.set(i, R, G, B)
+        vertex_index_array.set(i, i)
+
+    _set_points(fn_mesh, RGB if transform is None else transform(RGB))
     fn_mesh.setVertexColors(vertex_colour_array, vertex_index_array, None)
 
-    cmds.makeIdentity(cube, apply=True, t=True, r=True, s=True)
-    cmds.xform(cube, a=True, rotatePivot=(0, 0, 0), scalePivot=(0, 0, 0))
     return cmds.rename(cube, name)
 
 
+def RGB_identity_cube(name, density=20):
+    """
+    Creates an RGB identity cube with given name and geometric density.
+
+    Parameters
+    ----------
+    name : unicode
+        Cube name.
+    density : int, optional
+        Cube divisions count.
+
+    Returns
+    -------
+    unicode
+        Cube.
+    """
+
+    return _cube(name, density)
+
+
 def Lab_colourspace_cube(colourspace, density=20):
     """
     Creates a *CIE L\\*a\\*b\\** colourspace cube with geometric density.
@@ -218,18 +517,13 @@ def Lab_colourspace_cube(colourspace, density=20):
         *CIE L\\*a\\*b\\** Colourspace cube.
     """
 
-    cube = RGB_identity_cube(colourspace.name, density)
-    it_mesh_vertex = OpenMaya.MItMeshVertex(dag_path(cube))
-    while not it_mesh_vertex.isDone():
-        position = it_mesh_vertex.position(OpenMaya.MSpace.kObject)
-        it_mesh_vertex.setPosition(
-            mpoint(tuple(np.ravel(RGB_to_Lab((position[0],
-                                              position[1],
-                                              position[2],),
-                                             colourspace)))))
-        it_mesh_vertex.next()
-    set_attributes({'{0}.rotateX'.format(cube): 180,
-                    '{0}.rotateZ'.format(cube): 90})
+    cube = _cube(colourspace.name,
+                 density,
+                 lambda RGB: _RGB_to_Lab(RGB,
+                                         colourspace,
+                                         *_buffers(RGB.shape[0])[1:]))
+    set_attributes([(cube, 'rotateX', 180),
+                    (cube, 'rotateZ', 90)])
     cmds.makeIdentity(cube, apply=True, t=True, r=True, s=True)
     return cube
 
@@ -247,48 +541,120 @@ def Lab_coordinates_system_representation():
     group = cmds.createNode('transform')
 
     cube = cmds.polyCube(w=600, h=100, d=600, sx=12, sy=2, sz=12, ch=False)[0]
-    set_attributes({'{0}.translateY'.format(cube): 50,
-                    '{0}.overrideEnabled'.format(cube): True,
-                    '{0}.overrideDisplayType'.format(cube): 2,
-                    '{0}.overrideShading'.format(cube): False})
+    set_attributes([(cube, 'translateY', 50),
+                    (cube, 'overrideEnabled', True),
+                    (cube, 'overrideDisplayType', 2),
+                    (cube, 'overrideShading', False)])
     cmds.makeIdentity(cube, apply=True, t=True, r=True, s=True)
     cmds.select(['{0}.f[0:167]'.format(cube), '{0}.f[336:359]'.format(cube)])
     cmds.delete()
 
     cmds.nurbsToPolygonsPref(polyType=1, chordHeightRatio=0.975)
 
+    texts, meshes, names, attributes = [], [], [], []
     for label, position, name in (('-a*', (-350, 0), 'minus_a'),
                                   ('+a*', (350, 0), 'plus_a'),
                                   ('-b*', (0, 350), 'minus_b'),
                                   ('+b*', (0, -350), 'plus_b')):
-        curves = cmds.listRelatives(
-            cmds.textCurves(f='Arial Black Bold', t=label)[0])
+        text = cmds.textCurves(f='Arial Black Bold', t=label)[0]
+        # Each letter is converted on its own: a single "planarSrf" call
+        # would build one trimmed surface bounded by all the letters curves.
         mesh = cmds.polyUnite(*[cmds.planarSrf(x,
                                                ch=False,
                                                o=True,
                                                po=1)
-                                for x in curves],
+                                for x in cmds.listRelatives(text)],
                               ch=False)[0]
         cmds.xform(mesh, cp=True)
         cmds.xform(mesh, translation=(0, 0, 0), absolute=True)
-        cmds.makeIdentity(cube, apply=True, t=True, r=True, s=True)
-        cmds.select(mesh)
-        cmds.polyColorPerVertex(rgb=(0, 0, 0), cdo=True)
-        set_attributes({'{0}.translateX'.format(mesh): position[0],
-                        '{0}.translateZ'.format(mesh): position[1],
-                        '{0}.rotateX'.format(mesh): -90,
-                        '{0}.scaleX'.format(mesh): 50,
-                        '{0}.scaleY'.format(mesh): 50,
-                        '{0}.scaleY'.format(mesh): 50,
-                        '{0}.overrideEnabled'.format(mesh): True,
-                        '{0}.overrideDisplayType'.format(mesh): 2})
-        cmds.delete(cmds.listRelatives(curves, parent=True))
-        cmds.makeIdentity(mesh, apply=True, t=True, r=True, s=True)
-        mesh = cmds.rename(mesh, name)
-        cmds.parent(mesh, group)
+        attributes.extend([(mesh, 'translateX', position[0]),
+                           (mesh, 'translateZ', position[1]),
+                           (mesh, 'rotateX', -90),
+                           (mesh, 'scaleX', 50),
+                           (mesh, 'scaleY', 50),
+                           (mesh, 'overrideEnabled', True),
+                           (mesh, 'overrideDisplayType', 2)])
+        texts.append(text)
+        meshes.append(mesh)
+        names.append(name)
+
+    cmds.polyColorPerVertex(meshes, rgb=(0, 0, 0), cdo=True)
+    set_attributes(attributes)
+    cmds.delete(texts)
+    cmds.makeIdentity(meshes, apply=True, t=True, r=True, s=True)
+    cmds.parent([cmds.rename(mesh, name)
+                 for mesh, name in zip(meshes, names)],
+                group)
 
     cube = cmds.rename(cube, 'grid')
     cmds.parent(cube, group)
     cmds.rename(group, 'Lab_coordinates_system_representation')
 
     return True
+
+
+def _RGB_to_Lab_numba():
+    """
+    Returns the *Numba* kernel converting given (N, 3) array of linear *RGB*
+    values to *CIE Lab* colourspace in a single fused pass over the vertices,
+    importing *Numba* and compiling the kernel on first call.
+
+    Returns
+    -------
+    callable or None
+        *Numba* kernel or *None* if it cannot be built, in which case the
+        *NumPy* path is used.
+
+    Notes
+    -----
+    -   The kernel signature is
+        ``kernel(RGB_l, matrix, XYZ_r, Lab)`` with ``RGB_l`` the (N, 3) array
+        of linear *RGB* values, ``matrix`` the transposed *RGB* colourspace to
+        *CIE XYZ* matrix, ``XYZ_r`` the reference *illuminant* *CIE XYZ*
+        tristimulus values and ``Lab`` the (N, 3) array receiving the
+        *CIE Lab* values, all of them C-contiguous :class:`np.float32` arrays.
+    """
+
+    global _RGB_TO_LAB_NUMBA
+
+    if _RGB_TO_LAB_NUMBA is None:
+        # Any failure, e.g. an incompatible *Numba* installation, disables
+        # the kernel rather than breaking the conversion.
+        try:
+            from numba import njit, prange
+
+            # The kernel must not reference other kernels defined here so
+            # that it can be loaded from the *Numba* cache.
+            @njit('void(float32[:, ::1], float32[:, ::1], float32[::1], '
+                  'float32[:, ::1])',
+                  parallel=True,
+                  cache=True)
+            def RGB_to_Lab_numba(RGB, matrix, XYZ_r, Lab):
+                for i in prange(RGB.shape[0]):
+                    R, G, B = RGB[i, 0], RGB[i, 1], RGB[i, 2]
+                    X = (R * matrix[0, 0] +
+                         G * matrix[1, 0] +
+                         B * matrix[2, 0]) / XYZ_r[0]
+                    Y = (R * matrix[0, 1] +
+                         G * matrix[1, 1] +
+                         B * matrix[2, 1]) / XYZ_r[1]
+                    Z = (R * matrix[0, 2] +
+                         G * matrix[1, 2] +
+                         B * matrix[2, 2]) / XYZ_r[2]
+
+                    f_X = (X ** (1 / 3) if X > (24 / 116) ** 3 else
+                           (841 / 108) * X + 16 / 116)
+                    f_Y = (Y ** (1 / 3) if Y > (24 / 116) ** 3 else
+                           (841 / 108) * Y + 16 / 116)
+                    f_Z = (Z ** (1 / 3) if Z > (24 / 116) ** 3 else
+                           (841 / 108) * Z + 16 / 116)
+
+                    Lab[i, 0] = 116 * f_Y - 16
+                    Lab[i, 1] = 500 * (f_X - f_Y)
+                    Lab[i, 2] = 200 * (f_Y - f_Z)
+
+            _RGB_TO_LAB_NUMBA = RGB_to_Lab_numba
+        except Exception:
+            _RGB_TO_LAB_NUMBA = False
+
+    return _RGB_TO_LAB_NUMBA or None
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour_maya.plots` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+from copy import deepcopy
+
+from colour.colorimetry import ILLUMINANTS
+from colour.models import RGB_COLOURSPACES, RGB_to_XYZ, XYZ_to_Lab
+
+import colour_maya.plots
+from colour_maya.plots import RGB_to_Lab
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['RGB_GRID', 'TestRGB_to_Lab']
+
+RGB_GRID = np.reshape(
+    np.transpose(np.meshgrid(*[np.linspace(0, 1, 11)] * 3)), (-1, 3))
+"""
+*RGB* values sampling the unit cube with 11 steps per axis.
+
+RGB_GRID : ndarray
+"""
+
+
+def _RGB_to_Lab_reference(RGB, colourspace):
+    """
+    Converts given *RGB* values from given colourspace to *CIE Lab*
+    colourspace using *Colour* definitions.
+    """
+
+    return XYZ_to_Lab(
+        RGB_to_XYZ(RGB,
+                   colourspace.whitepoint,
+                   ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['E'],
+                   colourspace.to_XYZ,
+                   'Bradford',
+                   colourspace.cctf_decoding),
+        colourspace.whitepoint)
+
+
+class TestRGB_to_Lab(unittest.TestCase):
+    """
+    Defines :func:`colour_maya.plots.RGB_to_Lab` definition unit tests
+    methods.
+    """
+
+    def test_RGB_to_Lab(self):
+        """
+        Tests :func:`colour_maya.plots.RGB_to_Lab` definition.
+        """
+
+        for name in ('sRGB', 'ACEScg', 'ProPhoto RGB'):
+            colourspace = RGB_COLOURSPACES[name]
+            np.testing.assert_allclose(
+                RGB_to_Lab(RGB_GRID, colourspace),
+                _RGB_to_Lab_reference(RGB_GRID, colourspace),
+                atol=0.001)
+
+        np.testing.assert_allclose(
+            RGB_to_Lab(np.array([0.5, 0.2, 0.1]), RGB_COLOURSPACES['sRGB']),
+            _RGB_to_Lab_reference(
+                np.array([0.5, 0.2, 0.1]), RGB_COLOURSPACES['sRGB']),
+            atol=0.001)
+
+    def test_RGB_to_Lab_colourspace_changes(self):
+        """
+        Tests :func:`colour_maya.plots.RGB_to_Lab` definition with a
+        colourspace sharing its name with a previously converted one.
+        """
+
+        RGB = np.array([0.5, 0.2, 0.1])
+
+        colourspace = RGB_COLOURSPACES['sRGB']
+        RGB_to_Lab(RGB, colourspace)
+
+        colourspace = deepcopy(colourspace)
+        colourspace.whitepoint = ILLUMINANTS[
+            'CIE 1931 2 Degree Standard Observer']['D50']
+        np.testing.assert_allclose(
+            RGB_to_Lab(RGB, colourspace),
+            _RGB_to_Lab_reference(RGB, colourspace),
+            atol=0.001)
+
+    def test_RGB_to_Lab_numba(self):
+        """
+        Tests :func:`colour_maya.plots.RGB_to_Lab` definition using the
+        *Numba* kernel.
+        """
+
+        if colour_maya.plots._RGB_to_Lab_numba() is None:
+            self.skipTest('"Numba" kernel is not available!')
+
+        colourspace = RGB_COLOURSPACES['sRGB']
+
+        use_numba = colour_maya.plots.USE_NUMBA
+        colour_maya.plots.USE_NUMBA = True
+        try:
+            np.testing.assert_allclose(
+                RGB_to_Lab(RGB_GRID, colourspace),
+                _RGB_to_Lab_reference(RGB_GRID, colourspace),
+                atol=0.001)
+        finally:
+            colour_maya.plots.USE_NUMBA = use_numba
+
+
+if __name__ == '__main__':
+    unittest.main()